@@ -0,0 +1,118 @@
+import difflib
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# On-disk TTL cache for LLM exposure checks. The question set and system
+# instruction are deterministic for a given snapshot, so re-running a
+# report re-pays multi-second OpenAI/Gemini latency (and cost) for the
+# same answer. 7 days default: exposure answers drift slowly.
+DEFAULT_TTL = 7 * 86400
+
+_DB_PATH = Path(__file__).resolve().parent.parent / "snapshots" / "cache" / "llm_cache.db"
+_conn = None
+_lock = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "hash TEXT PRIMARY KEY, created INTEGER, payload BLOB, prompt TEXT)"
+        )
+        try:
+            # Older cache files predate the prompt column.
+            _conn.execute("ALTER TABLE llm_responses ADD COLUMN prompt TEXT")
+        except sqlite3.OperationalError:
+            pass
+        _conn.commit()
+    return _conn
+
+
+def make_key(store_name: str, questions: list, system_instruction: str = "") -> str:
+    raw = json.dumps(
+        {"name": store_name, "q": list(questions), "sys": system_instruction, "v": "v1"},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str, ttl: int = DEFAULT_TTL) -> Optional[Any]:
+    try:
+        with _lock:
+            row = _get_conn().execute(
+                "SELECT created, payload FROM llm_responses WHERE hash = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        created, payload = row
+        if time.time() - created > ttl:
+            return None
+        return pickle.loads(payload)
+    except Exception as e:
+        print(f"[CACHE] LLM cache read failed: {e}")
+        return None
+
+
+def get_similar(prompt: str, ttl: int = DEFAULT_TTL, threshold: float = 0.92) -> Optional[Any]:
+    """Near-duplicate lookup: best-effort "semantic" layer.
+
+    Prompts for stores in the same area/category differ only in a few
+    tokens, so a difflib ratio over recent entries catches what exact
+    hashing misses. No embedding model is involved (none is a dependency
+    of this project), so the threshold is deliberately high and callers
+    must opt in — a near-match response still names the *other* store.
+
+    Candidates are restricted to the caller's engine prefix ("gpt:",
+    "gem:", ...): prompts for the same store differ only in that prefix,
+    which alone is far too little distance for the ratio threshold, and
+    cross-engine hits would fill one engine's report slot with another
+    engine's answers.
+    """
+    try:
+        cutoff = int(time.time()) - ttl
+        prefix = prompt.split(":", 1)[0] + ":" if ":" in prompt else ""
+        with _lock:
+            rows = _get_conn().execute(
+                "SELECT prompt, payload FROM llm_responses "
+                "WHERE created > ? AND prompt IS NOT NULL AND prompt LIKE ? "
+                "ORDER BY created DESC LIMIT 200",
+                (cutoff, prefix + "%")
+            ).fetchall()
+        sm = difflib.SequenceMatcher()
+        sm.set_seq2(prompt)
+        best_payload, best_ratio = None, 0.0
+        for cand_prompt, payload in rows:
+            sm.set_seq1(cand_prompt)
+            if sm.real_quick_ratio() < threshold:
+                continue
+            ratio = sm.ratio()
+            if ratio > best_ratio:
+                best_payload, best_ratio = payload, ratio
+        if best_payload is not None and best_ratio >= threshold:
+            return pickle.loads(best_payload)
+        return None
+    except Exception as e:
+        print(f"[CACHE] LLM similar lookup failed: {e}")
+        return None
+
+
+def set(key: str, value: Any, prompt: str = None):
+    try:
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?)",
+                (key, int(time.time()), pickle.dumps(value), prompt)
+            )
+            conn.commit()
+    except Exception as e:
+        print(f"[CACHE] LLM cache write failed: {e}")
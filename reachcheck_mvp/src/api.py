@@ -5,7 +5,6 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-import requests
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -26,7 +25,7 @@ else:
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from collector import DataCollector
+from collector import DataCollector, _json, _SESSION
 from analyzer import Analyzer
 from report import ReportGenerator
 
@@ -190,12 +189,13 @@ def search_naver(query: str = Query(..., min_length=1)):
     params = {"query": query, "display": 5, "sort": "random"} 
     
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=5)
+        # Pooled session keeps the openapi.naver.com connection warm
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=5)
         
         if resp.status_code == 401:
             return JSONResponse(status_code=401, content={"error": "NAVER_AUTH_ERROR"})
             
-        data = resp.json()
+        data = _json(resp)
         items = data.get("items", [])
         
         if not items:
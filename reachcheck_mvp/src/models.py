@@ -7,7 +7,13 @@ class StatusColor(Enum):
     YELLOW = "yellow"
     RED = "red"
 
-@dataclass
+# The three per-analysis result types below are slotted: several
+# instances are built for every analysis and they are write-once, so
+# dropping the per-instance __dict__ shrinks them and speeds the
+# attribute reads done during report rendering. Types that go through
+# vars() for serialization (ReviewPhrase, ReviewSample) must keep
+# their __dict__.
+@dataclass(slots=True)
 class MapChannelStatus:
     channel_name: str  # Naver, Kakao, Google
     is_registered: bool
@@ -15,7 +21,7 @@ class MapChannelStatus:
     status_text: str  # Generated description
     color: StatusColor
 
-@dataclass
+@dataclass(slots=True)
 class AIEngineStatus:
     engine_name: str  # ChatGPT, Gemini, Claude, Perplexity
     is_mentioned: bool
@@ -26,7 +32,7 @@ class AIEngineStatus:
     interpretation: str
     color: StatusColor
 
-@dataclass
+@dataclass(slots=True)
 class ConsistencyResult:
     field_name: str  # Name, Address, Phone
     status: str      # Match, Mismatch, Missing
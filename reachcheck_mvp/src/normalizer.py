@@ -1,5 +1,11 @@
+import functools
 import re
 
+# The normalize_* helpers are pure string functions and the same
+# name/address/phone recurs across Google/Naver/Kakao within one run,
+# so a bounded LRU cache turns repeat calls into dict hits.
+
+@functools.lru_cache(maxsize=4096)
 def normalize_phone(phone: str) -> str:
     if not phone:
         return ""
@@ -10,6 +16,7 @@ def normalize_phone(phone: str) -> str:
         digits = "0" + digits[2:]
     return digits
 
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     if not name:
         return ""
@@ -21,6 +28,7 @@ def normalize_name(name: str) -> str:
     s = re.sub(r"(지점|점)$", "", s)
     return s.strip()
 
+@functools.lru_cache(maxsize=4096)
 def normalize_address(addr: str) -> str:
     if not addr:
         return ""
@@ -69,6 +77,7 @@ def is_valid_category_for_display(cat: str) -> bool:
     if norm in hidden_keywords: return False
     return True
 
+@functools.lru_cache(maxsize=4096)
 def normalize_category_for_ai(raw_cat: str) -> str:
     if not raw_cat:
         return None
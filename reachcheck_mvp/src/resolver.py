@@ -1,9 +1,16 @@
 from typing import List, Dict, Optional
 import os
-import requests
 from dotenv import load_dotenv
 from pathlib import Path
 
+# Shared pooled HTTP session (keep-alive + retries) from the collector
+from collector import _SESSION
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class StoreResolver:
     def __init__(self):
         # Explicitly load .env from project root
@@ -29,8 +36,10 @@ class StoreResolver:
         }
         
         try:
-            resp = requests.get(url, params=params)
-            data = resp.json()
+            resp = _SESSION.get(url, params=params, timeout=5)
+            # orjson decodes the textsearch payload noticeably faster
+            # than stdlib json; fall back when it isn't installed.
+            data = orjson.loads(resp.content) if orjson else resp.json()
             results = data.get("results", [])
             
             candidates = []
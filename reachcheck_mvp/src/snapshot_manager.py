@@ -1,11 +1,81 @@
+import hashlib
 import json
 import os
+import pickle
+import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from dataclasses import asdict
 from typing import Optional, Dict, Any
 from models import SnapshotData, StoreSchema, PhotoData
 
+# Bump when SnapshotData / StoreSchema change shape so stale cached
+# pickles are ignored instead of deserialized into the wrong schema.
+SNAPSHOT_CACHE_SCHEMA_VERSION = 1
+
+# Filename sanitization table: one C-level translate pass instead of
+# chained str.replace copies. Maps only the characters the old code
+# replaced so existing snapshot filenames keep matching find_latest.
+_FILENAME_TRANS = str.maketrans({"/": "_", " ": "_"})
+
+
+class SnapshotCache:
+    """
+    On-disk TTL cache for complete SnapshotData objects.
+
+    Upstream scraping (Playwright + Naver search + Kakao + Google) is by
+    far the most expensive part of collect(); repeated queries for the
+    same store within the TTL can skip it entirely. Backed by a single
+    SQLite file under snapshots/cache/.
+    """
+
+    def __init__(self, db_name: str = "snapshot_cache.db"):
+        cache_dir = Path(__file__).resolve().parent.parent / "snapshots" / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = cache_dir / db_name
+        # collect() may run on different threads (FastAPI / executor)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "key TEXT PRIMARY KEY, fetched_at INTEGER, "
+            "schema_version INTEGER, payload BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(norm_store_name: str, place_id: str = None, seed_address: str = None) -> str:
+        raw = f"{norm_store_name}|{place_id or seed_address or ''}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str, ttl: int = 86400) -> Optional[SnapshotData]:
+        try:
+            row = self._conn.execute(
+                "SELECT fetched_at, schema_version, payload FROM snapshots WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if not row:
+                return None
+            fetched_at, version, payload = row
+            if version != SNAPSHOT_CACHE_SCHEMA_VERSION:
+                return None
+            if time.time() - fetched_at > ttl:
+                return None
+            return pickle.loads(payload)
+        except Exception as e:
+            print(f"[CACHE] Snapshot read failed: {e}")
+            return None
+
+    def put(self, key: str, snapshot: SnapshotData):
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?)",
+                (key, int(time.time()), SNAPSHOT_CACHE_SCHEMA_VERSION, pickle.dumps(snapshot))
+            )
+            self._conn.commit()
+        except Exception as e:
+            print(f"[CACHE] Snapshot write failed: {e}")
+
 class SnapshotManager:
     def __init__(self, output_dir: str = "snapshots"):
         self.output_dir = Path(__file__).resolve().parent.parent / output_dir
@@ -16,7 +86,7 @@ class SnapshotManager:
         filename = f"{snapshot.store_id}_{snapshot.timestamp}.json"
         
         # Sanitize filename
-        filename = filename.replace("/", "_").replace(" ", "_")
+        filename = filename.translate(_FILENAME_TRANS)
         filepath = self.output_dir / filename
         
         data = asdict(snapshot)